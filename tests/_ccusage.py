@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+
+"""Shared ccusage runner for the test scripts.
+
+`npx ccusage@latest daily --json` takes several seconds, so the parsed output
+is cached on disk for a short while and reused across script runs. An
+installed ccusage (CCUSAGE_BIN or on PATH) is run directly to skip npx's
+per-run package resolution; npx is only the last resort.
+"""
+
+import functools
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+NPX_CMD = ['npx', 'ccusage@latest']
+DAILY_ARGS = ['daily', '--json']
+CACHE_DIR = Path(tempfile.gettempdir())
+CACHE_TTL = 60  # seconds
+
+# In-process copy of the parsed output, so commands sharing one interpreter
+# (see run_all.py) neither re-read nor re-parse it: path -> (loaded_at, data)
+_memory_cache = {}
+
+
+@functools.lru_cache(maxsize=None)
+def ccusage_cmd():
+    """Return the command prefix used to invoke ccusage, resolved once per process"""
+    # A global npm install links its bin onto PATH, so which() finds it
+    ccusage_bin = os.environ.get('CCUSAGE_BIN') or shutil.which('ccusage')
+    if not ccusage_bin:
+        return tuple(NPX_CMD)
+    if ccusage_bin.endswith('.js'):
+        return (shutil.which('node') or 'node', ccusage_bin)
+    return (ccusage_bin,)
+
+
+def _cache_path(since, until):
+    """Cache file for one --since/--until range; ranges never share a file"""
+    if since is None and until is None:
+        return CACHE_DIR / "ccusage_daily.json"
+    return CACHE_DIR / f"ccusage_daily_{since or ''}_{until or ''}.json"
+
+
+def _read_cache(path):
+    """Return (mtime, raw) for cached ccusage output if it is fresh enough, else None"""
+    try:
+        mtime = path.stat().st_mtime
+        if time.time() - mtime >= CACHE_TTL:
+            return None
+        with open(path, 'rb') as f:
+            return mtime, f.read()
+    except OSError:
+        return None
+
+
+def _write_cache(path, raw):
+    """Atomically replace the cache file so readers never see a partial write"""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(raw)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _load_daily(since=None, until=None, timeout=None):
+    """Return parsed `ccusage daily --json` output, running ccusage on a cache miss
+
+    `since` and `until` are YYYYMMDD strings passed through to ccusage, so the
+    date filtering happens before any JSON is emitted.
+    """
+    path = _cache_path(since, until)
+    cached = _memory_cache.get(path)
+    if cached is not None and time.time() - cached[0] < CACHE_TTL:
+        return cached[1]
+
+    cached = _read_cache(path)
+    if cached is not None:
+        mtime, raw = cached
+        data = loads(raw)
+        # Age the copy from when ccusage ran, not from when the file was read
+        _memory_cache[path] = (mtime, data)
+        return data
+
+    cmd = [*ccusage_cmd(), *DAILY_ARGS]
+    if since:
+        cmd += ['--since', since]
+    if until:
+        cmd += ['--until', until]
+    # Keep stdout as bytes; the parser decodes it itself
+    result = subprocess.run(cmd, capture_output=True,
+                            timeout=timeout, check=True)
+    # Parse before caching so output that isn't JSON (e.g. npm warnings on
+    # stdout) is never stored; the ValueError goes to the caller and the next
+    # call runs ccusage again
+    data = loads(result.stdout)
+    _write_cache(path, result.stdout)
+    _memory_cache[path] = (time.time(), data)
+    return data
+
+
+def get_day(date, timeout=None):
+    """Return the daily entry for `date` (YYYY-MM-DD), or None if there is none
+
+    Only that day is requested from ccusage. Raises subprocess.CalledProcessError
+    if ccusage exits with an error, subprocess.TimeoutExpired if it does not
+    finish within `timeout` seconds, and ValueError if its output is not JSON.
+    """
+    compact = date.replace('-', '')
+    # ccusage filters by date itself, so at most a single entry comes back
+    entries = _load_daily(compact, compact, timeout).get('daily', [])
+    return next((entry for entry in entries if entry.get('date') == date), None)
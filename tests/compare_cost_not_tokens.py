@@ -1,20 +1,7 @@
 #!/usr/bin/env python3
 
-import json
-import subprocess
+# Kept for backward compatibility; the check lives in run_all.py
+from run_all import main
 
-# Get ccusage data
-result = subprocess.run(['npx', 'ccusage@latest', 'daily', '--json'], 
-                       capture_output=True, text=True)
-data = json.loads(result.stdout)
-
-for entry in data.get('daily', []):
-    if entry.get('date') == '2025-06-09':
-        print(f"📊 ccusage for 2025-06-09:")
-        print(f"   Total TOKENS: {entry['totalTokens']:,}")
-        print(f"   Total COST: ${entry['totalCost']:.2f}")
-        print(f"\n💡 Key insight:")
-        print(f"   - Swift CLI shows correct TOKENS: {entry['totalTokens']:,}")
-        print(f"   - Swift MenuBar shows correct TOKENS but wrong COST")
-        print(f"   - The issue is COST CALCULATION, not token counting!")
-        break
\ No newline at end of file
+if __name__ == "__main__":
+    main(['cost-tokens'])
@@ -0,0 +1,813 @@
+#!/usr/bin/env python3
+
+"""All ccusage cross-check scripts as subcommands of a single process.
+
+Running several checks from one interpreter pays Python startup and imports
+once, and lets them share the in-process ccusage and LiteLLM caches and the
+JSON parser. The old per-check scripts are thin shims over this module.
+
+Only the standard library is required. orjson, simdjson, NumPy and Numba are
+picked up when installed.
+
+    python3 run_all.py all
+    python3 run_all.py compare --debug
+"""
+
+import argparse
+import functools
+import json
+import mmap
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+from _ccusage import get_day
+
+# orjson parses bytes directly and is several times faster than stdlib json
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+# simdjson only materializes the fields we actually read
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# NumPy vectorizes the cost sums; plain Python arithmetic is used without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+TARGET_DATE = '2025-06-09'
+
+
+def report_missing_day():
+    """Report that ccusage had no entry for the target date; returns exit status 1"""
+    print(f"No data found for {TARGET_DATE} in ccusage output", file=sys.stderr)
+    return 1
+
+
+# --- cost / cost-tokens -----------------------------------------------------
+
+def cmd_cost(args):
+    """ccusage token and cost totals for the target date"""
+    # Get ccusage cost for today
+    entry = get_day(TARGET_DATE)
+
+    if entry is not None:
+        print(f"📊 ccusage results for {TARGET_DATE}:")
+        print(f"   Total tokens: {entry['totalTokens']:,}")
+        print(f"   Total cost: ${entry['totalCost']:.2f}")
+
+    print("\n💡 If Swift menubar shows $668, that's ~$163 too high!")
+    print("   This suggests Opus pricing might still be wrong")
+    return 0 if entry is not None else report_missing_day()
+
+
+def cmd_cost_tokens(args):
+    """Point out that the mismatch is in cost, not in token counts"""
+    # Get ccusage data
+    entry = get_day(TARGET_DATE)
+
+    if entry is not None:
+        print(f"📊 ccusage for {TARGET_DATE}:")
+        print(f"   Total TOKENS: {entry['totalTokens']:,}")
+        print(f"   Total COST: ${entry['totalCost']:.2f}")
+        print(f"\n💡 Key insight:")
+        print(f"   - Swift CLI shows correct TOKENS: {entry['totalTokens']:,}")
+        print(f"   - Swift MenuBar shows correct TOKENS but wrong COST")
+        print(f"   - The issue is COST CALCULATION, not token counting!")
+    return 0 if entry is not None else report_missing_day()
+
+
+# --- cache-rate / reverse ---------------------------------------------------
+
+def cmd_cache_rate(args):
+    """Reverse-engineer the effective cache token rate from ccusage's total"""
+    # Get token counts
+    entry = get_day(TARGET_DATE)
+    if entry is None:
+        return report_missing_day()
+
+    input_tokens = entry['inputTokens']
+    output_tokens = entry['outputTokens']
+    cache_create = entry['cacheCreationTokens']
+    cache_read = entry['cacheReadTokens']
+    total_cost = entry['totalCost']
+    # [input, output, cache create, cache read]
+    tokens = [input_tokens, output_tokens, cache_create, cache_read]
+
+    if np is None:
+        def cost_at(rates):
+            return sum(count * rate for count, rate in zip(tokens, rates))
+    else:
+        token_vector = np.array(tokens, dtype=np.float64)
+
+        def cost_at(rates):
+            return float(token_vector @ np.array(rates, dtype=np.float64))
+
+    # Known rates
+    input_rate = 3e-06
+    output_rate = 1.5e-05
+
+    # Calculate non-cache cost
+    non_cache_cost = cost_at([input_rate, output_rate, 0.0, 0.0])
+
+    # What's left must be cache cost
+    cache_cost = total_cost - non_cache_cost
+    total_cache_tokens = cache_create + cache_read
+
+    # Calculate effective cache rate
+    if total_cache_tokens > 0:
+        effective_cache_rate = cache_cost / total_cache_tokens
+
+        print(f"🔍 Reverse Engineering Cache Rate:")
+        print(f"   Total cost: ${total_cost:.2f}")
+        print(f"   Non-cache cost: ${non_cache_cost:.2f}")
+        print(f"   Cache cost: ${cache_cost:.2f}")
+        print(f"   Total cache tokens: {total_cache_tokens:,}")
+        print(f"   Effective cache rate: ${effective_cache_rate:.8f} per token")
+        print(f"   = ${effective_cache_rate * 1_000_000:.2f} per million tokens")
+
+        # Test with this rate
+        test_cost = cost_at([input_rate, output_rate, effective_cache_rate, effective_cache_rate])
+        print(f"\n✅ Verification: ${test_cost:.2f} (should equal ${total_cost:.2f})")
+    return 0
+
+
+def make_scorer(input_rate, output_rate, cache_create_rate, cache_read_rate):
+    """Build cost(input, output, cache_create, cache_read) with the rates baked in
+
+    The rates are compiled in as literals, so each call is plain arithmetic on
+    constants. Works element-wise on NumPy arrays as well as on scalars.
+    """
+    rates = tuple(float(rate) for rate in (input_rate, output_rate, cache_create_rate, cache_read_rate))
+    src = "lambda i, o, cc, cr: i * {!r} + o * {!r} + cc * {!r} + cr * {!r}".format(*rates)
+    return eval(src)
+
+
+def cmd_reverse(args):
+    """Compare ccusage's total cost against a few candidate pricing scenarios"""
+    # Get token counts for today
+    entry = get_day(TARGET_DATE)
+    if entry is None:
+        return report_missing_day()
+
+    input_tokens = entry['inputTokens']
+    output_tokens = entry['outputTokens']
+    cache_create = entry['cacheCreationTokens']
+    cache_read = entry['cacheReadTokens']
+    total_cost = entry['totalCost']
+
+    print(f"📊 ccusage data for {TARGET_DATE}:")
+    print(f"   Input: {input_tokens:,}")
+    print(f"   Output: {output_tokens:,}")
+    print(f"   Cache Create: {cache_create:,}")
+    print(f"   Cache Read: {cache_read:,}")
+    print(f"   Total Cost: ${total_cost:.2f}")
+
+    # Try different pricing combinations
+    print(f"\n🔍 Testing pricing scenarios:")
+
+    sonnet_input = 3e-06
+    sonnet_output = 1.5e-05
+
+    # (label, [input, output, cache create, cache read] rates per token)
+    scenarios = [
+        # Scenario 1: All models use Sonnet pricing
+        ("All models at Sonnet rates", [sonnet_input, sonnet_output, 0.00000249, 0.00000249]),
+        # Scenario 2: Try different cache rates
+        ("Sonnet rates with higher cache ($3.75/M)", [sonnet_input, sonnet_output, 3.75e-06, 3.75e-06]),
+    ]
+
+    # One specialized scorer per scenario, built before any data is scored
+    scorers = [make_scorer(*scenario_rates) for _, scenario_rates in scenarios]
+    costs = [score(input_tokens, output_tokens, cache_create, cache_read) for score in scorers]
+
+    for i, ((label, _), cost) in enumerate(zip(scenarios, costs), start=1):
+        print(f"\n{i}. {label}:")
+        print(f"   Calculated: ${cost:.2f}")
+        print(f"   Difference: ${abs(cost - total_cost):.2f}")
+    return 0
+
+
+# --- litellm ----------------------------------------------------------------
+
+# Fetch LiteLLM pricing data (same as ccusage)
+LITELLM_URL = 'https://raw.githubusercontent.com/BerriAI/litellm/main/model_prices_and_context_window.json'
+
+# Local copy plus its ETag, revalidated with If-None-Match on each run
+LITELLM_CACHE_DIR = Path.home() / ".cache" / "ccusage-menubar"
+LITELLM_CACHE_FILE = LITELLM_CACHE_DIR / "litellm_pricing.json"
+LITELLM_ETAG_FILE = LITELLM_CACHE_DIR / "litellm_pricing.etag"
+
+
+def replace_file(path, data):
+    """Write data beside path and rename it into place, so readers never see a partial file"""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def forget_pricing_etag():
+    """Drop the saved ETag so the next request fetches the full body"""
+    try:
+        LITELLM_ETAG_FILE.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def store_pricing(raw, etag):
+    """Cache the pricing JSON, then its ETag; an ETag is only on disk beside the body it names"""
+    try:
+        LITELLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        LITELLM_ETAG_FILE.unlink(missing_ok=True)
+        replace_file(LITELLM_CACHE_FILE, raw)
+        if etag:
+            replace_file(LITELLM_ETAG_FILE, etag.encode())
+    except OSError:
+        pass
+
+
+def download_pricing(etag):
+    """GET the pricing JSON; returns (raw, etag), or (None, None) if it is unchanged"""
+    request = urllib.request.Request(LITELLM_URL)
+    if etag:
+        request.add_header('If-None-Match', etag)
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.read(), response.headers.get('ETag')
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return None, None
+        raise
+
+
+@functools.lru_cache(maxsize=None)
+def fetch_pricing():
+    """Return parsed LiteLLM pricing, reusing the cached copy when unchanged"""
+    etag = None
+    if LITELLM_CACHE_FILE.exists() and LITELLM_ETAG_FILE.exists():
+        etag = LITELLM_ETAG_FILE.read_text().strip() or None
+
+    try:
+        raw, new_etag = download_pricing(etag)
+        if raw is None:
+            try:
+                return loads(LITELLM_CACHE_FILE.read_bytes())
+            except (OSError, ValueError):
+                # The cached copy the ETag vouched for is unreadable; fetch it anew
+                forget_pricing_etag()
+                raw, new_etag = download_pricing(None)
+    except urllib.error.HTTPError:
+        # A server-side error is a real failure, not a sign we're offline
+        raise
+    except urllib.error.URLError:
+        # Offline: fall back to whatever we fetched last
+        if LITELLM_CACHE_FILE.exists():
+            return loads(LITELLM_CACHE_FILE.read_bytes())
+        raise
+
+    # Parse before caching so a broken download is never stored
+    data = loads(raw)
+    store_pricing(raw, new_etag)
+    return data
+
+
+def cmd_litellm(args):
+    """List the Claude 4 models and their rates in LiteLLM's pricing database"""
+    try:
+        data = fetch_pricing()
+
+        print("🔍 Searching for Claude models in LiteLLM pricing database...")
+        print("=" * 60)
+
+        # Search for models we're using
+        search_terms = ['claude-opus-4', 'claude-sonnet-4', 'claude-4', 'opus-4', 'sonnet-4', '20250514']
+        # One case-insensitive alternation instead of lowercasing every (model, term) pair
+        search_pattern = re.compile('|'.join(map(re.escape, search_terms)), re.IGNORECASE)
+
+        # Cheap substring prefilter narrows hundreds of models to the Claude ones
+        candidates = [(name, info) for name, info in data.items() if 'claude' in name.lower()]
+
+        found_any = False
+        for model_name, model_data in candidates:
+            if search_pattern.search(model_name):
+                found_any = True
+                print(f"\n📊 Model: {model_name}")
+                if 'input_cost_per_token' in model_data:
+                    print(f"   Input: ${model_data['input_cost_per_token']:.8f}/token = ${model_data['input_cost_per_token'] * 1_000_000:.2f}/M")
+                if 'output_cost_per_token' in model_data:
+                    print(f"   Output: ${model_data['output_cost_per_token']:.8f}/token = ${model_data['output_cost_per_token'] * 1_000_000:.2f}/M")
+                if 'cache_creation_input_token_cost' in model_data:
+                    print(f"   Cache Create: ${model_data['cache_creation_input_token_cost']:.8f}/token = ${model_data['cache_creation_input_token_cost'] * 1_000_000:.2f}/M")
+                if 'cache_read_input_token_cost' in model_data:
+                    print(f"   Cache Read: ${model_data['cache_read_input_token_cost']:.8f}/token = ${model_data['cache_read_input_token_cost'] * 1_000_000:.2f}/M")
+
+        if not found_any:
+            print("❌ No Claude-4 models found in LiteLLM database!")
+            print("\n💡 This means ccusage returns null from getModelPricing()!")
+            print("   When pricing is null, calculateCostFromTokens returns 0")
+            print("   This explains why all costs might be 0!")
+
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+    return 0
+
+
+# --- cost-field -------------------------------------------------------------
+
+# Raw-byte markers checked before parsing; false positives are fine because
+# survivors are still fully parsed and checked
+DATE_MARKER = f'"{TARGET_DATE}'.encode()
+COST_MARKER = b'"costUSD"'
+
+# Files below this size are read and parsed as a single batch; larger ones
+# are memory-mapped and parsed line by line to bound peak memory
+WHOLE_FILE_LIMIT = 8_000_000
+EXAMPLE_LIMIT = 3  # Show first few examples of each kind
+NUMBA_MIN_ROWS = 10_000_000  # Below this the plain NumPy sum is faster
+
+CLAUDE_PATH = Path.home() / ".claude" / "projects"
+
+
+def make_extractors():
+    """Return (extract, extract_batch) functions yielding (timestamp, costUSD, model)
+
+    extract() parses a single raw JSONL line; extract_batch() parses a list of
+    lines in one go by wrapping them into a JSON array.
+    """
+    if simdjson is not None:
+        # One parser per process; it owns the SIMD scratch buffers
+        parser = simdjson.Parser()
+
+        def fields(doc, with_cost):
+            try:
+                model = doc.at_pointer('/message/model')
+            except (KeyError, TypeError):
+                model = None
+            cost = doc.get('costUSD') if with_cost else None
+            return doc.get('timestamp', ''), cost, model
+
+        # Documents must not outlive these calls, or the parser can't be reused
+        def extract(line, with_cost=True):
+            return fields(parser.parse(line), with_cost)
+
+        def extract_batch(lines):
+            docs = parser.parse(b'[' + b','.join(lines) + b']')
+            return [fields(doc, COST_MARKER in line) for doc, line in zip(docs, lines)]
+
+        return extract, extract_batch
+
+    def fields(data, with_cost):
+        message = data.get('message')
+        model = message.get('model') if isinstance(message, dict) else None
+        cost = data.get('costUSD') if with_cost else None
+        return data.get('timestamp', ''), cost, model
+
+    def extract(line, with_cost=True):
+        return fields(loads(line), with_cost)
+
+    def extract_batch(lines):
+        records = loads(b'[' + b','.join(lines) + b']')
+        return [fields(data, COST_MARKER in line) for data, line in zip(records, lines)]
+
+    return extract, extract_batch
+
+
+extract_fields, extract_batch = make_extractors()
+
+
+def iter_jsonl(root):
+    """Yield paths of .jsonl files under root as plain strings
+
+    DirEntry reuses the file type from readdir, so no per-entry stat() is needed.
+    """
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from iter_jsonl(entry.path)
+                elif entry.name.endswith('.jsonl'):
+                    yield entry.path
+    except OSError:
+        return
+
+
+def iter_marked_lines(mm):
+    """Yield each line of a mapped file that contains DATE_MARKER
+
+    Jumps between marker hits with mm.find() (memchr/memmem in C) instead of
+    splitting every line, and only copies the lines that are returned.
+    """
+    pos = mm.find(DATE_MARKER)
+    while pos != -1:
+        start = mm.rfind(b'\n', 0, pos) + 1
+        end = mm.find(b'\n', pos)
+        if end == -1:
+            end = len(mm)
+        yield mm[start:end]
+        pos = mm.find(DATE_MARKER, end)
+
+
+@functools.lru_cache(maxsize=None)
+def numba_reducer():
+    """Return a Numba kernel summing costs[i] where mask[i] is set, or None
+
+    Resolved on first use, so runs that never need it don't import Numba.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    # Compiled once and cached on disk; the branchy sum runs across all cores
+    @njit(parallel=True, cache=True)
+    def reduce_costs(costs, mask):
+        total = 0.0
+        for i in prange(costs.size):
+            if mask[i]:
+                total += costs[i]
+        return total
+
+    return reduce_costs
+
+
+def sum_costs(cost_chunks, mask_chunks):
+    """Sum the masked costs across the per-file chunks returned by scan()"""
+    if np is None:
+        return sum(cost
+                   for costs, mask in zip(cost_chunks, mask_chunks)
+                   for cost, has in zip(costs, mask) if has)
+    if not cost_chunks:
+        return 0.0
+
+    costs = np.concatenate(cost_chunks)
+    mask = np.concatenate(mask_chunks)
+    # Importing Numba and dispatching the JIT costs far more than a masked
+    # NumPy sum of a few thousand rows, so only use it for very large inputs
+    if costs.size >= NUMBA_MIN_ROWS:
+        reducer = numba_reducer()
+        if reducer is not None:
+            return reducer(costs, mask)
+    return float(costs[mask].sum())
+
+
+def iter_records(f, size):
+    """Yield (timestamp, costUSD, model) for each line that passes the prefilter"""
+    if size < WHOLE_FILE_LIMIT:
+        buf = f.read()
+        if DATE_MARKER not in buf:
+            return
+        # Skip lines that cannot match before paying for a parse
+        lines = [line for line in buf.split(b'\n') if DATE_MARKER in line]
+        try:
+            records = extract_batch(lines)
+        except ValueError:
+            # A malformed line (e.g. a truncated tail) spoils the batch; redo
+            # it line by line so only that line is lost
+            records = iter_valid_records(lines)
+        yield from records
+        return
+
+    # Map large files instead of copying them into a bytes object
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield from iter_valid_records(iter_marked_lines(mm))
+
+
+def iter_valid_records(lines):
+    """Yield (timestamp, costUSD, model) per line, skipping lines that don't parse"""
+    for line in lines:
+        try:
+            yield extract_fields(line, COST_MARKER in line)
+        except ValueError:
+            continue
+
+
+def scan(jsonl_file):
+    """Scan one JSONL file and return (has_cost, no_cost, costs, mask, examples)
+
+    costs and mask are parallel NumPy arrays (plain lists without NumPy) over
+    the file's target-date entries; mask is set where the entry carries costUSD.
+    """
+    has_cost = 0
+    no_cost = 0
+    costs = []
+    mask = []
+    # (cost or None, model or None) in file order, capped per kind
+    examples = []
+
+    try:
+        with open(jsonl_file, 'rb') as f:
+            for timestamp, cost, model in iter_records(f, os.fstat(f.fileno()).st_size):
+                if timestamp.startswith(TARGET_DATE):
+                    if cost is not None and not isinstance(cost, (int, float)):
+                        # As the original script did, give up on the rest of
+                        # the file rather than pass a non-numeric cost along
+                        break
+                    costs.append(0.0 if cost is None else cost)
+                    mask.append(cost is not None)
+                    if cost is not None:
+                        has_cost += 1
+                        if has_cost <= EXAMPLE_LIMIT:
+                            examples.append((cost, model))
+                    else:
+                        no_cost += 1
+                        if no_cost <= EXAMPLE_LIMIT:
+                            examples.append((None, model))
+    except Exception:
+        pass
+
+    if np is None:
+        return has_cost, no_cost, costs, mask, examples
+    return (has_cost, no_cost, np.array(costs, dtype=np.float64),
+            np.array(mask, dtype=np.bool_), examples)
+
+
+def cmd_cost_field(args):
+    """Count target-date JSONL entries with and without a costUSD field"""
+    has_cost = 0
+    no_cost = 0
+    all_costs = []
+    all_masks = []
+    shown_with = 0
+    shown_without = 0
+
+    # Check actual JSONL entries for the target date, one file per worker
+    with ProcessPoolExecutor() as ex:
+        results = ex.map(scan, iter_jsonl(CLAUDE_PATH), chunksize=8)
+
+        for file_has_cost, file_no_cost, costs, mask, examples in results:
+            for cost, model in examples:
+                if cost is not None:
+                    if shown_with < EXAMPLE_LIMIT:
+                        shown_with += 1
+                        print(f"✅ Entry WITH costUSD: ${cost:.6f}")
+                        if model is not None:
+                            print(f"   Model: {model}")
+                elif shown_without < EXAMPLE_LIMIT:
+                    shown_without += 1
+                    print(f"❌ Entry WITHOUT costUSD")
+                    if model is not None:
+                        print(f"   Model: {model}")
+            has_cost += file_has_cost
+            no_cost += file_no_cost
+            all_costs.append(costs)
+            all_masks.append(mask)
+
+    total_cost_from_field = sum_costs(all_costs, all_masks)
+
+    print(f"\n📊 Summary for {TARGET_DATE}:")
+    print(f"Entries WITH costUSD: {has_cost}")
+    print(f"Entries WITHOUT costUSD: {no_cost}")
+    print(f"Total cost from costUSD fields: ${total_cost_from_field:.2f}")
+    print(f"\n💡 ccusage shows: $533.39")
+    print(f"Difference: ${533.39 - total_cost_from_field:.2f}")
+    return 0
+
+
+# --- compare ----------------------------------------------------------------
+
+# Compared metrics as parallel tuples so the comparison loop is a plain zip
+METRIC_LABELS = ('Input', 'Output', 'Cache Create', 'Cache Read', 'Total')
+METRIC_KEYS = ('inputTokens', 'outputTokens', 'cacheCreationTokens', 'cacheReadTokens', 'totalTokens')
+
+# Table templates, parsed once and reused for every row
+HEADER_FORMAT = "{:<15} {:<15} {:<15} {:<8} {:<12}".format
+ROW_FORMAT = "{:<15} {:<15,} {:<15,} {:<8} {:<12,}".format
+
+
+def run_ccusage_json():
+    """Run ccusage with JSON output and extract target-date data"""
+    try:
+        entry = get_day(TARGET_DATE, timeout=30)
+        if entry is not None:
+            return {
+                'tool': 'ccusage',
+                'date': entry['date'],
+                'inputTokens': entry['inputTokens'],
+                'outputTokens': entry['outputTokens'],
+                'cacheCreationTokens': entry['cacheCreationTokens'],
+                'cacheReadTokens': entry['cacheReadTokens'],
+                'totalTokens': entry['totalTokens'],
+                'totalCost': entry.get('totalCost', 0)
+            }
+
+        print(f"No data found for {TARGET_DATE} in ccusage output", file=sys.stderr)
+        return None
+
+    except subprocess.CalledProcessError as e:
+        print(f"ccusage failed: {e.stderr.decode(errors='replace')}", file=sys.stderr)
+        return None
+    except subprocess.TimeoutExpired:
+        print("ccusage timed out", file=sys.stderr)
+        return None
+    except ValueError as e:
+        print(f"Failed to parse ccusage JSON: {e}", file=sys.stderr)
+        return None
+    except Exception as e:
+        print(f"Error running ccusage: {e}", file=sys.stderr)
+        return None
+
+
+def run_swift_cli_json():
+    """Run Swift CLI with JSON output and extract target-date data"""
+    try:
+        # Change to parent directory to run swift-cli/simple_output.swift
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        parent_dir = os.path.dirname(script_dir)
+
+        result = subprocess.run(['swift', 'swift-cli/simple_output.swift', '--json'],
+                              capture_output=True, timeout=30, cwd=parent_dir)
+        if result.returncode != 0:
+            print(f"Swift CLI failed: {result.stderr.decode(errors='replace')}", file=sys.stderr)
+            return None
+
+        data = loads(result.stdout)
+
+        # Extract data (should be first entry in daily array)
+        daily_data = data.get('daily', [])
+        if daily_data:
+            entry = daily_data[0]
+            return {
+                'tool': 'swift_cli',
+                'date': entry['date'],
+                'inputTokens': entry['inputTokens'],
+                'outputTokens': entry['outputTokens'],
+                'cacheCreationTokens': entry['cacheCreationTokens'],
+                'cacheReadTokens': entry['cacheReadTokens'],
+                'totalTokens': entry['totalTokens'],
+                'totalCost': entry.get('totalCost', 0)
+            }
+
+        print("No daily data found in Swift CLI output", file=sys.stderr)
+        return None
+
+    except ValueError as e:
+        print(f"Failed to parse Swift CLI JSON: {e}", file=sys.stderr)
+        return None
+    except Exception as e:
+        print(f"Error running Swift CLI: {e}", file=sys.stderr)
+        return None
+
+
+def compare_results(ccusage_data, swift_data):
+    """Compare the two results and output formatted comparison"""
+
+    print(f"🔍 JSON Comparison for {TARGET_DATE}")
+    print("==================================")
+
+    # Format table
+    print(HEADER_FORMAT('Metric', 'ccusage', 'Swift CLI', 'Match', 'Diff'))
+    print("-" * 70)
+
+    ccusage_vals = tuple(ccusage_data.get(key, 0) for key in METRIC_KEYS)
+    swift_vals = tuple(swift_data.get(key, 0) for key in METRIC_KEYS)
+
+    all_match = True
+    total_diff = 0
+
+    for label, ccusage_val, swift_val in zip(METRIC_LABELS, ccusage_vals, swift_vals):
+        diff = abs(ccusage_val - swift_val)
+        match = "✅" if diff == 0 else "❌"
+
+        if diff != 0:
+            all_match = False
+            total_diff += diff
+
+        print(ROW_FORMAT(label, ccusage_val, swift_val, match, diff))
+
+    print("-" * 70)
+
+    if all_match:
+        print("🎉 PERFECT MATCH! Both tools produce identical results.")
+    else:
+        ccusage_total = ccusage_data.get('totalTokens', 0)
+        if ccusage_total > 0:
+            accuracy = (1.0 - total_diff / ccusage_total) * 100
+            print(f"📊 Accuracy: {accuracy:.2f}% (Total diff: {total_diff:,} tokens)")
+        else:
+            print(f"❌ Significant differences found (Total diff: {total_diff:,} tokens)")
+
+    return all_match
+
+
+def timed(fn):
+    """Call fn() and return (result, elapsed seconds)"""
+    start = time.time()
+    result = fn()
+    return result, time.time() - start
+
+
+def cmd_compare(args):
+    """Compare ccusage and Swift CLI token counts side by side"""
+    print("🚀 Running JSON-based comparison...")
+    print("=====================================")
+
+    # Time the operations
+    start_time = time.time()
+
+    # Both are waits on independent child processes, so overlap them
+    print("📊 Fetching ccusage and Swift CLI data...")
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        ccusage_future = ex.submit(timed, run_ccusage_json)
+        swift_future = ex.submit(timed, run_swift_cli_json)
+        ccusage_data, ccusage_time = ccusage_future.result()
+        swift_data, swift_time = swift_future.result()
+
+    total_time = time.time() - start_time
+
+    if not ccusage_data:
+        print("❌ Failed to get ccusage data")
+        return 1
+
+    if not swift_data:
+        print("❌ Failed to get Swift CLI data")
+        return 1
+
+    print()
+    compare_results(ccusage_data, swift_data)
+
+    print(f"\n⏱️  Performance:")
+    print(f"   ccusage: {ccusage_time:.2f}s")
+    print(f"   Swift CLI: {swift_time:.2f}s")
+    print(f"   Total: {total_time:.2f}s")
+
+    # Show raw JSON if requested
+    if args.debug:
+        print("\n🔍 Raw JSON Data:")
+        print("=================")
+        print("ccusage:")
+        print(json.dumps(ccusage_data, indent=2))
+        print("\nSwift CLI:")
+        print(json.dumps(swift_data, indent=2))
+    return 0
+
+
+# --- entry point ------------------------------------------------------------
+
+# name -> (handler, old standalone script)
+COMMANDS = {
+    'cost': (cmd_cost, 'test_cost.py'),
+    'cost-tokens': (cmd_cost_tokens, 'compare_cost_not_tokens.py'),
+    'cache-rate': (cmd_cache_rate, 'find_exact_cache_rate.py'),
+    'reverse': (cmd_reverse, 'reverse_engineer_pricing.py'),
+    'litellm': (cmd_litellm, 'check_litellm_pricing.py'),
+    'cost-field': (cmd_cost_field, 'check_costUSD_field.py'),
+    'compare': (cmd_compare, 'compare_json.py'),
+}
+
+
+def cmd_all(args):
+    """Run every check in turn; exit status is non-zero if any check failed"""
+    status = 0
+    for name, (handler, _) in COMMANDS.items():
+        print(f"\n===== {name} =====")
+        try:
+            status = max(status, handler(args))
+        except Exception as e:
+            # Keep going; later checks may not depend on what failed here
+            print(f"❌ {name} failed: {e!r}", file=sys.stderr)
+            status = 1
+    return status
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    for name, (handler, script) in COMMANDS.items():
+        sub = subparsers.add_parser(name, help=f"{handler.__doc__} (was {script})")
+        sub.set_defaults(func=handler)
+    subparsers.choices['compare'].add_argument('--debug', action='store_true',
+                                               help="also print the raw JSON data")
+
+    sub = subparsers.add_parser('all', help=cmd_all.__doc__)
+    sub.add_argument('--debug', action='store_true', help="passed on to compare")
+    sub.set_defaults(func=cmd_all)
+
+    args = parser.parse_args(argv)
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()